@@ -1,32 +1,50 @@
-from faker import Faker
 import random
-from main import AddressBook, Record, Note
+import sys
+from main import AddressBook, Birthday, Note, Phone, Record
 
-fake = Faker()
+_fake = None
+
+
+def get_fake():
+    """Повертає спільний екземпляр Faker, створений при першому виклику."""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+
+        _fake = Faker()
+    return _fake
 
 
 def generate_fake_contacts(book: AddressBook, num_contacts=10):
     """Генерує фейкові контакти та додає їх до AddressBook."""
+    fake = get_fake()
     for _ in range(num_contacts):
         try:
             record = Record(f"{fake.first_name()} {fake.last_name()}")
 
-            # Додаємо телефони (1-3 номери)
-            for _ in range(random.randint(1, 3)):
-                phone = fake.numerify(text="##########")  # 10 цифр
-                record.add_phone(phone)
+            # Усі випадкові рішення для контакту беремо з одного виклику:
+            # біти 0-2 — прапорці email/дня народження/адреси,
+            # решта 13 бітів — кількість телефонів
+            bits = random.getrandbits(16)
+
+            # Додаємо телефони (1-3 номери); numerify завжди дає 10 цифр,
+            # тож повторна валідація не потрібна
+            for _ in range(1 + (bits >> 3) % 3):
+                phone = fake.numerify(text="##########")
+                record._append_phone(Phone._unchecked(sys.intern(phone)))
 
             # Додаємо email (50% ймовірність)
-            if random.choice([True, False]):
+            if bits & 1:
                 record.add_email(fake.email())
 
             # Додаємо день народження (50% ймовірність)
-            if random.choice([True, False]):
+            if bits & 2:
                 birth_date = fake.date_of_birth(minimum_age=18, maximum_age=90)
-                record.add_birthday(birth_date.strftime("%d.%m.%Y"))
+                # дата вже готова — без кругового strftime/strptime
+                record.birthday = Birthday._unchecked(birth_date)
 
             # Додаємо адресу (50% ймовірність)
-            if random.choice([True, False]):
+            if bits & 4:
                 record.add_address(fake.address().replace("\n", ", "))
 
             book.add_record(record)
@@ -36,6 +54,7 @@ def generate_fake_contacts(book: AddressBook, num_contacts=10):
 
 def generate_fake_notes(book: AddressBook, num_notes=5):
     """Генерує фейкові нотатки та додає їх до AddressBook."""
+    fake = get_fake()
     tags = ["#work", "#personal", "#family", "#friends", "#todo", None]
     for _ in range(num_notes):
         title = fake.sentence(nb_words=3)[:-1]  # Прибираємо крапку в кінці
@@ -48,8 +67,9 @@ def fill_with_fake_data(book: AddressBook, num_contacts=15, num_notes=5):
     """Заповнює AddressBook фейковими даними
     (попередньо очищаємо видаляємо старі записи книги)."""
     print("Clearing the contact book...")
-    book.data.clear()
+    book.clear()
     book.notes.clear()
+    book.mark_notes_changed()
 
     print("Generating fake data...")
     generate_fake_contacts(book, num_contacts)
@@ -1,23 +1,23 @@
 """Основний модуль для логіки бота-помічника."""
 
+import _compat_pickle
+import copyreg
 import os
 import pickle
 import re
-from collections import UserDict
+import sys
+from bisect import bisect_left, bisect_right, insort
 from datetime import date, datetime
-from difflib import SequenceMatcher
-from functools import wraps
-
-from colorama import Fore, Style, init
-from rich.box import ROUNDED
-from rich.console import Console
-from rich.table import Table
+from functools import lru_cache, wraps
+from itertools import cycle
+from operator import attrgetter, itemgetter
 
 COLORS = ["cyan", "magenta", "green", "yellow", "blue", "bright_red", "white"]
-init(autoreset=True)
-ERROR = Fore.RED
-FIELD = Fore.MAGENTA
-RESET_ALL = Style.RESET_ALL
+# ANSI-коди кольорів (ті самі, що colorama.Fore.RED / MAGENTA і
+# Style.RESET_ALL); сам colorama потрібен лише для main()
+ERROR = "\x1b[31m"
+FIELD = "\x1b[35m"
+RESET_ALL = "\x1b[0m"
 
 DATE_FORMAT = "%d.%m.%Y"
 EMAIL_VALIDATION_ERROR = (
@@ -29,11 +29,158 @@ EMAIL_VALIDATION_ERROR = (
     " etc. (minimum 2 characters)."
 )
 BIRTHDAY_VALIDATION_ERROR = "Invalid date format. Use DD.MM.YYYY"
+# Повідомлення з кольором, зібрані один раз; .format підставляє значення
+_EMAIL_ERROR = ERROR + EMAIL_VALIDATION_ERROR
+_BIRTHDAY_ERROR = ERROR + BIRTHDAY_VALIDATION_ERROR
+_PHONE_FORMAT_ERROR = (
+    ERROR + "Incorrect phone format {}. Should be 10 digits."
+).format
+_CONTACT_NOT_FOUND_ERROR = (ERROR + "Contact with name {} not found.").format
+# Підписи полів у Record.__str__
+_TITLE_NAME = FIELD + "Contact name:" + RESET_ALL
+_TITLE_PHONES = FIELD + "phones:" + RESET_ALL
+_TITLE_BIRTHDAY = FIELD + "birthday:" + RESET_ALL
+_TITLE_EMAIL = FIELD + "email:" + RESET_ALL
+_TITLE_ADDRESS = FIELD + "address:" + RESET_ALL
+IO_BUFFER_SIZE = 1 << 20
+# Знімок переписується, коли журнал стає більшим за знімок у стільки разів
+JOURNAL_COMPACT_RATIO = 4
+EXIT_COMMANDS = frozenset(("close", "exit"))
+# Команди, що видаляють дані або завершують сеанс, виконуються лише за
+# повною назвою — для їхнього початку показується підказка
+PREFIX_EXCLUDED_COMMANDS = frozenset(
+    ("close", "delete", "delete-note", "exit", "generate-data")
+)
+# Більші таблиці, як і вивід не в термінал, друкуються простим текстом
+TABLE_RENDER_LIMIT = 10000
+
+_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w{2,}$")
+_CONSOLE = None
+
+
+def _get_console():
+    """Повертає спільний rich Console, створюючи його при першому виклику."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+
+        _CONSOLE = Console()
+    return _CONSOLE
+
+
+def _parse_date(value: str) -> date:
+    """
+    Розбирає дату у форматі DD.MM.YYYY без повільного strptime.
+
+    Як і strptime, приймає день і місяць з однієї цифри; для некоректного
+    значення піднімає ValueError.
+    """
+    parts = value.split(".")
+    if len(parts) != 3:
+        raise ValueError(value)
+    day, month, year = parts
+    if not (
+        0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4
+        and day.isdecimal() and month.isdecimal() and year.isdecimal()
+    ):
+        raise ValueError(value)
+    return date(int(year), int(month), int(day))
+
+
+def _is_leap_year(year: int) -> bool:
+    """Перевіряє високосний рік (як calendar.isleap, без імпорту calendar)."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _format_date(value: date) -> str:
+    """Форматує дату як DD.MM.YYYY без strftime."""
+    return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+
+
+def _field_names(obj):
+    """Повертає публічні назви атрибутів об'єкта зі __slots__ або __dict__."""
+    slots = getattr(type(obj), "__slots__", None)
+    names = slots if slots is not None else vars(obj)
+    return tuple(name for name in names if not name.startswith("_"))
+
+
+def _field_value(field):
+    """Повертає значення поля; старі файли тримають email/адресу рядком."""
+    return getattr(field, "value", field)
+
+
+def _set_slots_state(obj, state):
+    """Відновлює атрибути зі стану pickle (словник або пара словників)."""
+    if isinstance(state, tuple):
+        # стан за замовчуванням для __slots__: (None, {слот: значення})
+        state = state[1] or {}
+    for key, value in state.items():
+        setattr(obj, key, value)
+
+
+def _format_cell(value):
+    """Перетворює значення поля на текст комірки таблиці."""
+    if value is None:
+        return "---"
+    return str(value)
+
+
+def _format_list_cell(value):
+    """Перетворює список значень (наприклад, телефони) на текст комірки."""
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return _format_cell(value)
+
+
+def _column_formatters(values):
+    """Обирає форматування для кожної колонки за значеннями першого рядка."""
+    return [
+        _format_list_cell if isinstance(value, list) else _format_cell
+        for value in values
+    ]
+
+
+def _row_extractor(first, headers):
+    """Повертає функцію, що дістає значення всіх колонок з одного рядка."""
+    if not isinstance(first, dict):
+        getter = attrgetter(*headers)
+
+        def fallback(item):
+            return [getattr(item, h, None) for h in headers]
+    else:
+        getter = itemgetter(*headers)
+
+        def fallback(item):
+            return [item.get(h, None) for h in headers]
+
+    single = len(headers) == 1
+
+    def extract(item):
+        try:
+            values = getter(item)
+        except (AttributeError, KeyError):
+            # рядок без частини полів — повільний шлях зі значенням None
+            return fallback(item)
+        return (values,) if single else values
+
+    return extract
+
+
+def _print_plain_table(title, columns, rows):
+    """Виводить таблицю простим текстом, колонки розділені табуляцією."""
+    lines = [title, "\t".join(caption for caption, _ in columns)]
+    lines.extend("\t".join(row) for row in rows)
+    print("\n".join(lines))
 
 
 def as_table(title="Table"):
     """Декоратор для форматування виводу функції у вигляді таблиці."""
     def decorator(func):
+        # Розкладка колонок для кожної форми рядків, яку вже виводили:
+        # (тип, поля) -> (колонки зі стилями, функція вибору значень,
+        #                 форматування колонок, чи є розділи end-section)
+        layouts = {}
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
@@ -43,15 +190,49 @@ def as_table(title="Table"):
 
             # обираємо перший запис для визначення назв полів
             first = result[0]
-            if hasattr(first, "__dict__"):
-                headers = list(first.__dict__.keys())
-            elif isinstance(first, dict):
-                headers = list(first.keys())
+            if isinstance(first, dict):
+                keys = tuple(first)
+            elif hasattr(first, "__dict__") or hasattr(first, "__slots__"):
+                keys = _field_names(first)
             else:
                 return result
 
-            headers = [h for h in headers if h != "end-section"]
-            console = Console()
+            layout = layouts.get((type(first), keys))
+            if layout is None:
+                headers = [
+                    h for h in keys
+                    if h != "end-section" and not h.startswith("_")
+                ]
+                columns = [
+                    (h.capitalize(), color)
+                    for h, color in zip(headers, cycle(COLORS))
+                ]
+                extract = _row_extractor(first, headers)
+                layout = (
+                    columns,
+                    extract,
+                    _column_formatters(extract(first)),
+                    "end-section" in keys,
+                )
+                layouts[(type(first), keys)] = layout
+            columns, extract, formatters, has_sections = layout
+
+            def format_row(item):
+                return [
+                    format_cell(value)
+                    for format_cell, value in zip(formatters, extract(item))
+                ]
+
+            # Без термінала rich не потрібен: ні Console, ні побудова Table
+            if len(result) > TABLE_RENDER_LIMIT or not sys.stdout.isatty():
+                _print_plain_table(title, columns, map(format_row, result))
+                return ""
+
+            # rich імпортуємо лише тоді, коли справді потрібно вивести таблицю
+            from rich.box import ROUNDED
+            from rich.table import Table
+
+            console = _get_console()
             terminal_width = console.width
 
             table = Table(
@@ -62,35 +243,12 @@ def as_table(title="Table"):
                 show_edge=True,
                 box=ROUNDED,
             )
-            for i, h in enumerate(headers):
-                table.add_column(
-                    h.capitalize(),
-                    style=COLORS[i % len(COLORS)],
-                    no_wrap=False,
-                    ratio=1,
-                )
+            for caption, style in columns:
+                table.add_column(caption, style=style, no_wrap=False, ratio=1)
 
-            end_section = False
             for item in result:
-                if isinstance(item, dict) and item.get("end-section"):
-                    end_section = True
-
-                row = []
-                for h in headers:
-                    value = (
-                        getattr(item, h, None)
-                        if hasattr(item, "__dict__")
-                        else item.get(h, None)
-                    )
-                    if isinstance(value, list):
-                        value = ", ".join(str(v) for v in value)
-                    elif value is None:
-                        value = "---"
-                    else:
-                        value = str(value)
-                    row.append(value)
-                table.add_row(*row, end_section=end_section)
-                end_section = False
+                end_section = has_sections and bool(item.get("end-section"))
+                table.add_row(*format_row(item), end_section=end_section)
 
             console.print(table)
             return ""  # запобігання повторного виводу
@@ -103,10 +261,27 @@ def as_table(title="Table"):
 class Field:
     """Базовий клас для зберігання значення поля запису."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         """Ініціалізує поле зі значенням."""
         self.value = value
 
+    @classmethod
+    def _unchecked(cls, value):
+        """Створює поле з уже перевіреного значення, оминаючи валідацію."""
+        field = cls.__new__(cls)
+        Field.__init__(field, value)
+        return field
+
+    def __getstate__(self):
+        """Повертає стан поля для pickle."""
+        return {"value": self.value}
+
+    def __setstate__(self, state):
+        """Відновлює поле, зокрема зі старих файлів зі станом у __dict__."""
+        _set_slots_state(self, state)
+
     def __str__(self):
         """Повертає рядкове представлення значення поля."""
         return str(self.value)
@@ -115,6 +290,8 @@ class Field:
 class Name(Field):
     """Клас для зберігання імені контакту з валідацією."""
 
+    __slots__ = ()
+
     def __init__(self, name: str):
         """Ініціалізує поле імені. Ім'я має містити щонайменше 2 символи."""
         if len(name.strip()) < 2:
@@ -127,47 +304,76 @@ class Name(Field):
 class Phone(Field):
     """Клас для зберігання та валідації номера телефону."""
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         """Ініціалізує поле зі значенням."""
-        if not re.fullmatch(r"\d{10}", value):
-            raise Exception(
-                ERROR + f"Incorrect phone format {value}. Should be 10 digits."
-            )
-        super().__init__(value)
+        if not self.is_valid(value):
+            raise Exception(_PHONE_FORMAT_ERROR(value))
+        super().__init__(sys.intern(value))
+
+    @staticmethod
+    def is_valid(value: str) -> bool:
+        """Перевіряє, що номер складається рівно з 10 цифр."""
+        return len(value) == 10 and value.isdecimal()
+
+    @classmethod
+    def tryparse(cls, value: str):
+        """Повертає Phone для коректного номера або None — без винятку."""
+        if not cls.is_valid(value):
+            return None
+        # Як і __init__, зберігаємо один об'єкт рядка на номер
+        return cls._unchecked(sys.intern(value))
 
     def __str__(self):
         """Повертає номер телефону у форматі (###) ###-#-###."""
-        match = re.fullmatch(r"(\d{3})(\d{2})(\d{2})(\d{3})", self.value)
-        return (
-            f"({match.group(1)}) {match.group(2)}-" +
-            f"{match.group(3)}-{match.group(4)}"
-        )
+        value = self.value
+        return f"({value[:3]}) {value[3:5]}-{value[5:7]}-{value[7:]}"
 
 
 class Birthday(Field):
     """Клас для зберігання дати народження з валідацією формату."""
 
+    __slots__ = ()
+
     def __init__(self, value):
         """Ініціалізує дату народження. Очікується формат DD.MM.YYYY."""
         try:
-            self.value = datetime.strptime(value, DATE_FORMAT).date()
+            self.value = _parse_date(value)
+        except ValueError:
+            raise Exception(_BIRTHDAY_ERROR)
+
+    @classmethod
+    def tryparse(cls, value: str):
+        """Повертає Birthday для коректної дати або None — без винятку."""
+        try:
+            return cls._unchecked(_parse_date(value))
         except ValueError:
-            raise Exception(ERROR + BIRTHDAY_VALIDATION_ERROR)
+            return None
 
     def __str__(self):
         """Повертає дату у форматі DD.MM.YYYY або '---' якщо вона відсутня."""
-        return self.value.strftime(DATE_FORMAT) if self.value else "---"
+        return _format_date(self.value) if self.value else "---"
 
 
 class Email(Field):
     """Клас для зберігання email-адреси з валідацією."""
 
+    __slots__ = ()
+
     def __init__(self, value):
         """Ініціалізує email. Якщо формат некоректний — викликає виняток."""
         if is_valid_email(value):
-            self.value = value
+            self.value = sys.intern(value)
         else:
-            raise Exception(ERROR + EMAIL_VALIDATION_ERROR)
+            raise Exception(_EMAIL_ERROR)
+
+    @classmethod
+    def tryparse(cls, value: str):
+        """Повертає Email для коректної адреси або None — без винятку."""
+        if not is_valid_email(value):
+            return None
+        return cls._unchecked(sys.intern(value))
 
     def __str__(self):
         """Повертає email або '---', якщо він відсутній."""
@@ -177,22 +383,57 @@ class Email(Field):
 class Address(Field):
     """Клас для зберігання адреси контакту."""
 
-    pass
+    __slots__ = ()
 
 
 class Note:
     """Клас для представлення нотатки з назвою, текстом та тегом."""
 
+    __slots__ = ("title", "note", "tag")
+
     def __init__(self, title, text, tag=None):
         """Ініціалізація нотатки."""
         self.title = title
         self.note = text
-        self.tag = tag
+        self.set_tag(tag)
+
+    def set_tag(self, tag):
+        """Встановлює тег; однакові теги нотаток ділять один рядок."""
+        self.tag = sys.intern(tag) if tag else tag
+
+    def __getstate__(self):
+        """Повертає стан нотатки для pickle — кортеж _to_row."""
+        return self._to_row()
+
+    def __setstate__(self, state):
+        """Відновлює нотатку, зокрема зі старих файлів зі станом у __dict__."""
+        if isinstance(state, tuple) and len(state) == 3:
+            self.title, self.note, tag = state
+            self.set_tag(tag)
+            return
+        _set_slots_state(self, state)
+
+    def _to_row(self) -> tuple:
+        """Повертає нотатку як кортеж рядків для файлу даних."""
+        return (self.title, self.note, self.tag)
+
+    @classmethod
+    def _from_row(cls, row: tuple) -> "Note":
+        """Відновлює нотатку з кортежу _to_row."""
+        return cls(*row)
 
 
 class Record:
     """Клас для представлення запису в адресній книзі."""
 
+    # _book — адресна книга, до якої належить запис (встановлює add_record);
+    # _phone_index — номер -> перший Phone з таким номером у self.phones;
+    # _str_cache — результат __str__, скидається при кожній зміні запису
+    __slots__ = (
+        "name", "phones", "birthday", "email", "address",
+        "_book", "_phone_index", "_str_cache",
+    )
+
     def __init__(self, name: str):
         """Ініціалізація нового запису."""
         self.name = Name(name)
@@ -200,44 +441,108 @@ class Record:
         self.birthday: Birthday = None
         self.email: Email = None
         self.address: Address = None
+        self._book = None
+        self._phone_index: dict[str, Phone] = {}
+        self._str_cache = None
+
+    def _unindex(self):
+        """Прибирає запис з індексів книги перед зміною його полів."""
+        if self._book is not None:
+            self._book._unindex_record(self.name.value, self)
+
+    def _touch(self):
+        """Оновлює індекси книги та позначає запис зміненим для журналу."""
+        self._str_cache = None
+        if self._book is not None:
+            self._book._index_record(self)
+            self._book._changed.add(self.name.value)
 
     def change_name(self, book, new_name):
         """Змінює ім’я контакту в книзі."""
         old_name = self.name.value
         self.name = Name(new_name)
+        self._str_cache = None
         book.update_record_name(old_name, self)
         return "Contact updated."
 
     def add_phone(self, phone):
-        """Додавання телефонів."""
-        self.phones.append(Phone(phone))
+        """Додавання телефонів (рядком або вже перевіреним Phone)."""
+        self._append_phone(phone if isinstance(phone, Phone) else Phone(phone))
+        self._touch()
         return "Contact updated."
 
+    def add_phones(self, values):
+        """
+        Додає кілька телефонів за один прохід.
+
+        Спершу перевіряються всі номери; якщо хоч один некоректний,
+        жоден не додається.
+        """
+        values = list(values)
+        invalid = [value for value in values if not Phone.is_valid(value)]
+        if invalid:
+            raise Exception(_PHONE_FORMAT_ERROR(", ".join(invalid)))
+        phones = [Phone._unchecked(sys.intern(value)) for value in values]
+        self.phones.extend(phones)
+        for phone in phones:
+            self._phone_index.setdefault(phone.value, phone)
+        self._touch()
+        return "Contact updated."
+
+    def _append_phone(self, phone: Phone):
+        """Додає вже створений Phone до списку та індексу телефонів."""
+        self.phones.append(phone)
+        self._phone_index.setdefault(phone.value, phone)
+        self._str_cache = None
+
+    def _reindex_phones(self):
+        """Перебудовує індекс телефонів зі списку self.phones."""
+        self._phone_index = {}
+        for phone in self.phones:
+            self._phone_index.setdefault(phone.value, phone)
+
     def remove_phone(self, phone):
         """Видалення телефонів."""
-        self.phones = [p for p in self.phones if p.value != phone]
+        if phone not in self._phone_index:
+            return
+        self._unindex()
+        del self._phone_index[phone]
+        # Видаляємо на місці, йдучи з кінця, щоб індекси не зсувались
+        for i in range(len(self.phones) - 1, -1, -1):
+            if self.phones[i].value == phone:
+                del self.phones[i]
+        self._touch()
 
     def edit_phone(self, old_phone, new_phone):
         """Редагування телефонів."""
-        for phone in self.phones:
-            if phone.value == old_phone:
-                phone.value = Phone(new_phone).value
-                return "Contact updated."
-        raise Exception(
-            ERROR + f'You want to change: {old_phone}\n' +
-                    'Error: "Phone number not found."'
-        )
+        phone = self._phone_index.get(old_phone)
+        if phone is None:
+            raise Exception(
+                ERROR + f'You want to change: {old_phone}\n' +
+                        'Error: "Phone number not found."'
+            )
+        # Перевіряємо рядок без створення тимчасового Phone
+        if not Phone.is_valid(new_phone):
+            raise Exception(_PHONE_FORMAT_ERROR(new_phone))
+        new_value = sys.intern(new_phone)
+        self._unindex()
+        phone.value = new_value
+        self._reindex_phones()
+        self._touch()
+        return "Contact updated."
 
     def find_phone(self, search_phone):
         """Пошук телефону."""
-        for phone in self.phones:
-            if phone.value == search_phone:
-                return phone
-        return None
+        return self._phone_index.get(search_phone)
 
     def add_birthday(self, birthday):
-        """Додавання дня народження."""
-        self.birthday = Birthday(birthday)
+        """Додавання дня народження (рядком або вже перевіреним Birthday)."""
+        new_birthday = (
+            birthday if isinstance(birthday, Birthday) else Birthday(birthday)
+        )
+        self._unindex()
+        self.birthday = new_birthday
+        self._touch()
         return "Contact updated."
 
     def add_address(self, address: str):
@@ -247,45 +552,332 @@ class Record:
                 ERROR + "Address should contain at least 2 characters"
             )
 
-        self.address = Address(address)
+        new_address = Address(address)
+        self._unindex()
+        self.address = new_address
+        self._touch()
         return "Address added."
 
     def add_email(self, email):
-        """Додавання email адреси."""
-        self.email = Email(email)
+        """Додавання email адреси (рядком або вже перевіреним Email)."""
+        new_email = email if isinstance(email, Email) else Email(email)
+        self._unindex()
+        self.email = new_email
+        self._touch()
         return "Email added."
 
+    def __getstate__(self):
+        """Повертає компактний стан для pickle — кортеж _to_row."""
+        return self._to_row()
+
+    def __setstate__(self, state):
+        """Відновлює запис, зокрема зі старих файлів зі станом у __dict__."""
+        if isinstance(state, tuple) and len(state) == 5:
+            self._load_row(state)
+            return
+        self.birthday = self.email = self.address = self._book = None
+        self._str_cache = None
+        _set_slots_state(self, state)
+        self._reindex_phones()
+
+    def _to_row(self) -> tuple:
+        """Повертає запис як кортеж вбудованих типів для файлу даних."""
+        return (
+            self.name.value,
+            [phone.value for phone in self.phones],
+            self.birthday.value.toordinal() if self.birthday else None,
+            _field_value(self.email),
+            _field_value(self.address),
+        )
+
+    @classmethod
+    def _from_row(cls, row: tuple) -> "Record":
+        """Відновлює запис з кортежу _to_row без повторної валідації."""
+        record = cls.__new__(cls)
+        record._load_row(row)
+        return record
+
+    def _load_row(self, row: tuple):
+        """Заповнює поля запису з кортежу _to_row."""
+        name, phones, birthday, email, address = row
+        # Однакові значення у різних контактів ділять один об'єкт рядка,
+        # а порівняння в індексах спершу перевіряють тотожність
+        intern = sys.intern
+        self.name = Name._unchecked(name)
+        self.phones = [Phone._unchecked(intern(phone)) for phone in phones]
+        self.birthday = (
+            Birthday._unchecked(date.fromordinal(birthday))
+            if birthday is not None
+            else None
+        )
+        self.email = Email._unchecked(intern(email)) if email else None
+        self.address = (
+            Address._unchecked(intern(address)) if address else None
+        )
+        self._book = None
+        self._str_cache = None
+        self._reindex_phones()
+
     def __str__(self):
-        """Повертає текстове представлення запису."""
-        title_name = FIELD + "Contact name:" + RESET_ALL
-        title_phones = FIELD + "phones:" + RESET_ALL
-        title_birthday = FIELD + "birthday:" + RESET_ALL
-        title_email = FIELD + "email:" + RESET_ALL
-        title_address = FIELD + "address:" + RESET_ALL
+        """Повертає текстове представлення запису (кешоване до змін)."""
+        if self._str_cache is None:
+            self._str_cache = self._render()
+        return self._str_cache
+
+    def _render(self):
+        """Будує текстове представлення запису."""
+        phones = "; ".join([phone.value for phone in self.phones])
         return (
-            f"{title_name} {self.name.value}, " +
-            f"{title_phones} {'; '.join(p.value for p in self.phones)}, " +
-            f"{title_birthday} {self.birthday if self.birthday else '---'}, " +
-            f"{title_email} {self.email if self.email else '---'}, " +
-            f"{title_address} {self.address if self.address else '---'}"
+            f"{_TITLE_NAME} {self.name.value}, "
+            f"{_TITLE_PHONES} {phones}, "
+            f"{_TITLE_BIRTHDAY} {self.birthday if self.birthday else '---'}, "
+            f"{_TITLE_EMAIL} {self.email if self.email else '---'}, "
+            f"{_TITLE_ADDRESS} {self.address if self.address else '---'}"
         )
 
 
-class AddressBook(UserDict):
-    """Клас для зберігання контактів та нотаток. Наслідує UserDict."""
+class AddressBook(dict):
+    """Клас для зберігання контактів та нотаток. Наслідує dict."""
 
     def __init__(self):
         """Ініціалізація адресної книги."""
         super().__init__()
         self.notes = []
+        # Індекси нотаток, що будуються при першому пошуку після змін
+        self._notes_index = None
+        # Нотатки, відсортовані за тегом (будується при першому sort-tags)
+        self._notes_by_tag = None
+        # Індекс днів народження: (місяць, день) -> імена контактів
+        self._birthdays: dict[tuple[int, int], set[str]] = {}
+        # Відсортовані ключі індексу днів народження для пошуку bisect
+        self._birthday_keys: list[tuple[int, int]] = []
+        # Готові результати get_upcoming_birthdays: (сьогодні, днів) -> список
+        self._upcoming_cache: dict[tuple[date, int], list[dict]] = {}
+        # Зворотні індекси для пошуку: значення поля -> імена контактів
+        self._by_phone: dict[str, set[str]] = {}
+        self._by_email: dict[str, set[str]] = {}
+        self._by_address: dict[str, set[str]] = {}
+        # Ідентифікатор знімка, до якого дописується журнал змін
+        self._journal_id = None
+        # True, якщо файл даних не вдалося прочитати і відкласти —
+        # тоді save_data нічого не пише, щоб не затерти його
+        self._read_only = False
+        self._reset_changes()
+
+    def _reset_changes(self):
+        """Скидає відомості про зміни з моменту останнього збереження."""
+        # Імена контактів, змінених або видалених після збереження
+        self._changed: set[str] = set()
+        self._notes_changed = False
+        # Шлях, у який книгу збережено востаннє (для дописування журналу)
+        self._saved_to = None
+        # Після clear() журнал не має сенсу — потрібен повний знімок
+        self._snapshot_required = False
+
+    def __getstate__(self):
+        """Повертає стан для pickle без індексів (вони перебудовуються)."""
+        state = self.__dict__.copy()
+        for key in (
+            "_birthdays", "_birthday_keys", "_upcoming_cache",
+            "_notes_index", "_notes_by_tag",
+            "_by_phone", "_by_email", "_by_address",
+            "_changed", "_notes_changed", "_saved_to", "_snapshot_required",
+            "_read_only",
+        ):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        """Відновлює стан після pickle та перебудовує індекси."""
+        # Файли, збережені до переходу з UserDict, тримають записи в "data"
+        legacy_data = state.pop("data", None)
+        if legacy_data:
+            self.update(legacy_data)
+        self._journal_id = None
+        self._notes_index = None
+        self._notes_by_tag = None
+        self._read_only = False
+        self.__dict__.update(state)
+        self._reset_changes()
+        self._birthdays = {}
+        self._birthday_keys = []
+        self._upcoming_cache = {}
+        self._by_phone = {}
+        self._by_email = {}
+        self._by_address = {}
+        for record in self.values():
+            record._book = self
+            self._index_record(record)
+
+    @property
+    def data(self):
+        """Повертає саму книгу (сумісність з API UserDict)."""
+        return self
+
+    def _record_keys(self, record: Record):
+        """Повертає пари (індекс, ключ) для полів запису."""
+        keys = [(self._by_phone, phone.value) for phone in record.phones]
+        if record.birthday:
+            birthday = record.birthday.value
+            keys.append((self._birthdays, (birthday.month, birthday.day)))
+        email = _field_value(record.email)
+        if email:
+            keys.append((self._by_email, email))
+        address = _field_value(record.address)
+        if address:
+            keys.append((self._by_address, address))
+        return keys
+
+    def _index_record(self, record: Record):
+        """Додає поля запису до індексів книги."""
+        name = record.name.value
+        for index, key in self._record_keys(record):
+            names = index.get(key)
+            if index is self._birthdays:
+                self._upcoming_cache.clear()
+                if names is None:
+                    insort(self._birthday_keys, key)
+            if names is None:
+                names = index[key] = set()
+            names.add(name)
+
+    def _unindex_record(self, name: str, record: Record):
+        """Видаляє поля запису з індексів книги."""
+        for index, key in self._record_keys(record):
+            names = index.get(key)
+            if names is not None:
+                if index is self._birthdays:
+                    self._upcoming_cache.clear()
+                names.discard(name)
+                if not names:
+                    del index[key]
+                    if index is self._birthdays:
+                        keys = self._birthday_keys
+                        del keys[bisect_left(keys, key)]
 
     def find(self, name):
         """Пошук контакту за ім’ям."""
-        return self.data.get(name)
+        return self.get(name)
+
+    def _first_added(self, names):
+        """Повертає запис з names, доданий до книги найраніше, або None."""
+        if not names:
+            return None
+        if len(names) == 1:
+            return self[next(iter(names))]
+        # Спільне значення в кількох контактів — як і раніше, перемагає
+        # перший контакт у порядку додавання
+        for name in self:
+            if name in names:
+                return self[name]
+        return None
+
+    def find_by_value(self, value: str):
+        """
+        Шукає контакт за ім’ям, телефоном, email чи адресою в індексах.
+
+        Якщо значення мають кілька контактів, повертається доданий
+        найраніше — незалежно від того, у якому полі знайдено збіг.
+        """
+        names = set()
+        if value in self:
+            names.add(value)
+        for index in (self._by_phone, self._by_email, self._by_address):
+            names.update(index.get(value, ()))
+        return self._first_added(names)
+
+    def find_by_phone(self, phone: str):
+        """Шукає контакт з номером телефону phone в індексі."""
+        return self._first_added(self._by_phone.get(phone))
+
+    def find_by_birthday(self, birthday: date):
+        """Шукає контакт з днем народження birthday в індексі."""
+        names = self._birthdays.get((birthday.month, birthday.day), ())
+        return self._first_added({
+            name for name in names
+            if self[name].birthday.value == birthday
+        })
 
     def add_note(self, note):
         """Додає нотатку до книги."""
         self.notes.append(note)
+        self.mark_notes_changed()
+
+    def remove_note(self, note):
+        """Видаляє нотатку з книги."""
+        self.notes.remove(note)
+        self.mark_notes_changed()
+
+    def remove_notes(self, notes) -> int:
+        """
+        Видаляє кілька нотаток одним проходом по списку.
+
+        :return: Кількість видалених нотаток.
+        """
+        removed = {id(note) for note in notes}
+        before = len(self.notes)
+        # Зміна на місці: посилання на book.notes лишаються дійсними
+        self.notes[:] = [
+            note for note in self.notes if id(note) not in removed
+        ]
+        if len(self.notes) != before:
+            self.mark_notes_changed()
+        return before - len(self.notes)
+
+    def mark_notes_changed(self):
+        """Позначає нотатки зміненими після редагування на місці."""
+        self._notes_changed = True
+        self._notes_index = None
+        self._notes_by_tag = None
+
+    def _get_notes_index(self):
+        """
+        Повертає індекси нотаток, перебудовуючи їх після змін.
+
+        :return: (назва -> нотатки, тег -> нотатки, пари (нотатка, текст
+            для пошуку)); ключі та текст — у нижньому регістрі.
+        """
+        if self._notes_index is None:
+            by_title = {}
+            by_tag = {}
+            texts = []
+            for note in self.notes:
+                by_title.setdefault(note.title.lower(), []).append(note)
+                if note.tag:
+                    by_tag.setdefault(note.tag.lower(), []).append(note)
+                text = "\0".join((note.title, note.note, note.tag or ""))
+                texts.append((note, text.lower()))
+            self._notes_index = (by_title, by_tag, texts)
+        return self._notes_index
+
+    def find_notes_by_title(self, title: str) -> list[Note]:
+        """Повертає нотатки з назвою title (без урахування регістру)."""
+        return list(self._get_notes_index()[0].get(title.lower(), ()))
+
+    def find_notes_by_tag(self, tag: str) -> list[Note]:
+        """Повертає нотатки з тегом tag (без урахування регістру)."""
+        return list(self._get_notes_index()[1].get(tag.lower(), ()))
+
+    def search_notes(self, keyword: str) -> list[Note]:
+        """Повертає нотатки, у назві, тексті чи тегу яких є keyword."""
+        keyword = keyword.lower()
+        return [
+            note for note, text in self._get_notes_index()[2]
+            if keyword in text
+        ]
+
+    def get_notes_sorted_by_tag(self) -> list[Note]:
+        """
+        Повертає нотатки, відсортовані за тегом; нотатки без тегу — вкінці.
+
+        Порядок обчислюється один раз і зберігається до наступної зміни
+        нотаток.
+        """
+        if self._notes_by_tag is None:
+            self._notes_by_tag = sorted(
+                self.notes, key=lambda x: (x.tag is None, x.tag or "")
+            )
+        return list(self._notes_by_tag)
 
     def get_notes(self):
         """Повертає список усіх нотаток."""
@@ -293,7 +885,16 @@ class AddressBook(UserDict):
 
     def add_record(self, record: Record):
         """Додає запис до адресної книги."""
-        self.data[record.name.value] = record
+        name = record.name.value
+        # setdefault дає один пошук у словнику для нового контакту
+        previous = self.setdefault(name, record)
+        if previous is not record:
+            self._unindex_record(name, previous)
+            previous._book = None
+            self[name] = record
+        record._book = self
+        self._index_record(record)
+        self._changed.add(name)
 
     def update_record_name(self, old_name: str, record: Record):
         """Оновлює ім’я існуючого запису, зберігаючи його дані."""
@@ -302,59 +903,97 @@ class AddressBook(UserDict):
 
     def add_notes(self, note):
         """Додає нотатку як запис."""
-        self.data[note.tite] = note
+        self[note.tite] = note
 
     def get_all(self) -> list[Record]:
         """Повертає всі записи з адресної книги."""
-        return list(self.data.values())
+        return list(self.values())
 
     def delete(self, name):
         """Видалення записів за іменем."""
-        if name in self.data:
-            del self.data[name]
+        if name in self:
+            record = self.pop(name)
+            self._unindex_record(name, record)
+            record._book = None
+            self._changed.add(name)
             return "Contact deleted"
         else:
-            raise Exception(ERROR + f"Contact with name {name} not found.")
+            raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
+
+    def clear(self):
+        """Видаляє всі записи книги разом з індексами."""
+        for record in self.values():
+            record._book = None
+        super().clear()
+        self._birthdays.clear()
+        self._birthday_keys.clear()
+        self._upcoming_cache.clear()
+        self._by_phone.clear()
+        self._by_email.clear()
+        self._by_address.clear()
+        self._snapshot_required = True
 
     def get_upcoming_birthdays(self, days_count):
-        """Повертає список привітань на найближчі дні."""
-        result = []
+        """
+        Повертає список привітань на найближчі дні.
+
+        Результат запам'ятовується до наступної зміни днів народження
+        або до зміни дати; повертається копія списку.
+        """
         today = datetime.today().date()
-        for record in self.data.values():
-            if record.birthday:
-                name = record.name.value
-                birthday = record.birthday.value
-                birthday_this_year = date(
-                    today.year, birthday.month, birthday.day
-                )
-                birthday_next_year = date(
-                    today.year + 1, birthday.month, birthday.day
-                )
-                delta = (birthday_this_year - today).days
-                delta_next = (birthday_next_year - today).days
-                if 0 <= delta <= days_count:
-                    result.append(
-                        {
-                            "name": name,
-                            "congratulation_date": birthday_this_year.strftime(
-                                DATE_FORMAT
-                            ),
-                        }
-                    )
-                elif 0 <= delta_next <= days_count:
+        cache_key = (today, days_count)
+        cached = self._upcoming_cache.get(cache_key)
+        if cached is None:
+            cached = self._compute_upcoming_birthdays(today, days_count)
+            if len(self._upcoming_cache) >= 32:
+                self._upcoming_cache.clear()
+            self._upcoming_cache[cache_key] = cached
+        return list(cached)
+
+    def _compute_upcoming_birthdays(self, today: date, days_count: int):
+        """Збирає привітання з індексу днів народження (без кешу)."""
+        result = []
+        seen = set()
+        today_ordinal = today.toordinal()
+        # Як і раніше, враховуємо дні народження цього та наступного року
+        last_ordinal = min(
+            today_ordinal + days_count,
+            date(today.year + 1, 12, 31).toordinal(),
+        )
+        if last_ordinal < today_ordinal:
+            return result
+        last_day = date.fromordinal(last_ordinal)
+        keys = self._birthday_keys
+
+        for year in range(today.year, last_day.year + 1):
+            # Вікно в межах одного року — зріз відсортованих (місяць, день)
+            first_key = (
+                (today.month, today.day) if year == today.year else (1, 1)
+            )
+            last_key = (
+                (last_day.month, last_day.day)
+                if year == last_day.year
+                else (12, 31)
+            )
+            start = bisect_left(keys, first_key)
+            stop = bisect_right(keys, last_key)
+            for month, day in keys[start:stop]:
+                if month == 2 and day == 29 and not _is_leap_year(year):
+                    continue
+                congratulation_date = f"{day:02d}.{month:02d}.{year:04d}"
+                for name in sorted(self._birthdays[(month, day)] - seen):
+                    seen.add(name)
                     result.append(
                         {
                             "name": name,
-                            "congratulation_date": birthday_next_year.strftime(
-                                DATE_FORMAT
-                            ),
+                            "congratulation_date": congratulation_date,
                         }
                     )
         return result
 
     def __str__(self):
         """Повертає текстове представлення всіх записів книги."""
-        return "\n".join(str(record) for record in self.data.values())
+        return "\n".join(str(record) for record in self.values())
 
 
 def input_error(func):
@@ -399,27 +1038,25 @@ def add_contact(book: AddressBook):
             "Input phones in format: " +
             "<ph1> <ph2> ... (each phone 10 digits length): "
         )
-        for phone in phones.split():
-            try:
-                record.add_phone(phone)
-            except Exception as e:
-                raise Exception(str(e))
+        record.add_phones(phones.split())
 
         if len(record.phones) < 1:
             return
         email = input("Add email or leave blanc: ")
         if len(email.strip()):
-            try:
-                record.add_email(email.strip())
-            except Exception:
-                print(ERROR + EMAIL_VALIDATION_ERROR)
+            parsed_email = Email.tryparse(email.strip())
+            if parsed_email is not None:
+                record.add_email(parsed_email)
+            else:
+                print(_EMAIL_ERROR)
                 print("You can add email later using the command 'add-email'")
         birthday = input("Add birthday in format DD.MM.YYYY or leave blanc: ")
         if len(birthday.strip()):
-            try:
-                record.add_birthday(birthday.strip())
-            except Exception:
-                print(ERROR + BIRTHDAY_VALIDATION_ERROR)
+            parsed_birthday = Birthday.tryparse(birthday.strip())
+            if parsed_birthday is not None:
+                record.add_birthday(parsed_birthday)
+            else:
+                print(_BIRTHDAY_ERROR)
                 print(
                     "You can add birthday later " +
                     "using the command 'add-birthday'"
@@ -434,13 +1071,97 @@ def add_contact(book: AddressBook):
     return "Contact added."
 
 
+def _build_record(line: str) -> Record:
+    """
+    Створює запис з рядка name|ph1,ph2|email|birthday|address.
+
+    Усі поля перевіряються за один прохід; якщо щось некоректне,
+    виняток містить усі знайдені помилки. Порожні необов'язкові поля
+    (email, день народження, адреса) можна пропустити.
+    """
+    name, phones, email, birthday, address = (
+        line.rstrip("\n").split("|") + ["", "", "", ""]
+    )[:5]
+    name = name.strip()
+    errors = []
+
+    if len(name) < 2:
+        errors.append("Name should contain at least 2 characters")
+    values = [phone.strip() for phone in phones.split(",") if phone.strip()]
+    if not values:
+        errors.append("At least one phone is required")
+    invalid = [value for value in values if not Phone.is_valid(value)]
+    if invalid:
+        errors.append(
+            f"Incorrect phone format {', '.join(invalid)}. "
+            "Should be 10 digits."
+        )
+    parsed_email = Email.tryparse(email.strip()) if email.strip() else None
+    if email.strip() and parsed_email is None:
+        errors.append(f"Invalid email {email.strip()}")
+    parsed_birthday = (
+        Birthday.tryparse(birthday.strip()) if birthday.strip() else None
+    )
+    if birthday.strip() and parsed_birthday is None:
+        errors.append(BIRTHDAY_VALIDATION_ERROR)
+    address = address.strip()
+    if address and len(address) < 2:
+        errors.append("Address should contain at least 2 characters")
+    if errors:
+        raise Exception(ERROR + "; ".join(errors))
+
+    record = Record.__new__(Record)
+    record._load_row((
+        name,
+        values,
+        parsed_birthday.value.toordinal() if parsed_birthday else None,
+        parsed_email.value if parsed_email else None,
+        address or None,
+    ))
+    return record
+
+
+def add_contact_batch(book: AddressBook, line: str):
+    """Додає контакт з одного рядка формату _build_record."""
+    record = _build_record(line)
+    name = record.name.value
+    if name in book:
+        raise Exception(ERROR + f"contact with name {name} already exists")
+    book.add_record(record)
+    return "Contact added."
+
+
+@input_error
+def add_contacts_from_file(book: AddressBook):
+    """Додає контакти з файлу, по одному рядку на контакт."""
+    path = input(
+        "Please type a path to a file with lines " +
+        "name|ph1,ph2|email|DD.MM.YYYY|address: "
+    ).strip()
+    added = 0
+    errors = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                add_contact_batch(book, line)
+                added += 1
+            except Exception as e:
+                errors.append(f"line {number}: {e}")
+    report = f"Added {added} contact(s)."
+    if errors:
+        report += "\n" + "\n".join(errors)
+    return report
+
+
 @input_error
 def change_contact(book: AddressBook):
     """Змінює телефон існуючого контакту."""
     name = input("Please type a name: ").strip()
     record = book.find(name)
     if record:
-        record_keys = list(record.__dict__.keys())
+        record_keys = list(_field_names(record))
         input_message = (
             "Please pass one of the following fields that you " +
             f"want to change or pass 'exit': {record_keys}: "
@@ -478,7 +1199,7 @@ def change_contact(book: AddressBook):
             user_input = input(commands[key]["prompt"])
             return commands[key]["action"](user_input)
 
-    raise Exception(ERROR + f"Contact with name {name} not found.")
+    raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
 
 
 @as_table(title="Contact info")
@@ -492,7 +1213,7 @@ def show_phone(book: AddressBook):
         for i, phone in enumerate(record.phones, start=1):
             result[f"phone{i}"] = phone.value
         return [result]
-    raise Exception(ERROR + f"Contact with name {name} not found.")
+    raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
 
 
 @input_error
@@ -506,7 +1227,7 @@ def add_birthday(book: AddressBook):
             "(example 01.01.2000): "
         )
         return record.add_birthday(birthday)
-    raise Exception(ERROR + f"Contact with name {name} not found.")
+    raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
 
 
 @as_table(title="Contact Birthday")
@@ -517,7 +1238,7 @@ def show_birthday(book):
     record = book.find(name)
 
     if not record:
-        raise Exception(ERROR + f"Contact with name {name} not found.")
+        raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
     if not record.birthday:
         raise Exception(ERROR + f"Birthday for contact {name} not added yet.")
 
@@ -550,19 +1271,23 @@ def show_all(book):
     if not book:
         return "No contacts saved."
     else:
-        return list(book.data.values())
+        return list(book.values())
 
 
 @input_error
 def add_address(book: AddressBook):
-    """Додає адресу до контакту."""
+    """
+    Додає адресу до контакту.
+
+    Адреса перевіряється Record.add_address, як і в add та change:
+    коротша за 2 символи відхиляється з повідомленням про помилку.
+    """
     name = input("Please type a name: ")
     record = book.find(name)
     if record:
         address = input("Please type address: ")
-        record.address = address
-        return "Address added."
-    raise Exception(ERROR + f"Contact with name {name} not found.")
+        return record.add_address(address)
+    raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
 
 
 @input_error
@@ -572,7 +1297,7 @@ def add_email(book: AddressBook):
     record = book.find(name)
 
     if not record:
-        raise Exception(ERROR + f"Contact with name {name} not found.")
+        raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
 
     email = input("Please type email: ")
     return record.add_email(email)
@@ -623,27 +1348,20 @@ def delete_note(book):
 
     if method == "title":
         title = input("Please type the title of the note to delete: ").strip()
-        deleted = [
-            note for note in book.notes if note.title.lower() == title.lower()
-        ]
+        deleted = book.find_notes_by_title(title)
         if not deleted:
             raise Exception(f"No notes found with title '{title}'")
-        for note in deleted:
-            book.notes.remove(note)
-        return f"Deleted {len(deleted)} note(s) with title '{title}'"
+        count = book.remove_notes(deleted)
+        return f"Deleted {count} note(s) with title '{title}'"
 
     elif method == "tag":
         tag = input(
             "Please type the tag of the notes to delete (include #): ").strip()
-        deleted = [
-            note for note in book.notes if note.tag and
-                                           note.tag.lower() == tag.lower()
-        ]
+        deleted = book.find_notes_by_tag(tag)
         if not deleted:
             raise Exception(f"No notes found with tag '{tag}'")
-        for note in deleted:
-            book.notes.remove(note)
-        return f"Deleted {len(deleted)} note(s) with tag '{tag}'"
+        count = book.remove_notes(deleted)
+        return f"Deleted {count} note(s) with tag '{tag}'"
 
     else:
         raise Exception("Invalid option. Choose 'title' or 'tag'.")
@@ -653,9 +1371,7 @@ def delete_note(book):
 def edit_note(book):
     """Редагує існуючу нотатку за назвою (title)."""
     title = input("Please type the title of the note to edit: ").strip()
-    note = next(
-        (n for n in book.notes if n.title.lower() == title.lower()), None
-    )
+    note = next(iter(book.find_notes_by_title(title)), None)
 
     if not note:
         raise Exception(ERROR + f"Note with title '{title}' not found.")
@@ -679,14 +1395,15 @@ def edit_note(book):
         "tag": {
             "prompt": "Enter new tag (start with #) or " +
                       "leave blank to remove tag: ",
-            "action": lambda data: setattr(
-                note, "tag", data if data.startswith("#") else None
+            "action": lambda data: note.set_tag(
+                data if data.startswith("#") else None
             ),
         },
     }
 
     user_input = input(commands[key]["prompt"])
     commands[key]["action"](user_input)
+    book.mark_notes_changed()
     return f"Note '{title}' updated successfully."
 
 
@@ -700,15 +1417,12 @@ def search_note(book):
         raise Exception("Keyword is required for note search.")
 
     matches = []
-    for note in book.get_notes():
-        if (keyword in note.title.lower()
-            or keyword in note.note.lower()
-            or (note.tag and keyword in note.tag.lower())):
-            matches.append({
-                "Title": note.title,
-                "Note": note.note,
-                "Tag": note.tag or "---"
-            })
+    for note in book.search_notes(keyword):
+        matches.append({
+            "Title": note.title,
+            "Note": note.note,
+            "Tag": note.tag or "---"
+        })
 
     if not matches:
         raise Exception(f"No notes found matching '{keyword}'.")
@@ -717,8 +1431,8 @@ def search_note(book):
 
 def is_valid_email(email) -> bool:
     """Валідатор для email адреси."""
-    pattern = r"^[\w\.-]+@[\w\.-]+\.\w{2,}$"
-    return re.match(pattern, email) is not None
+    # Без "@" адреса точно некоректна — не запускаємо регулярний вираз
+    return "@" in email and _EMAIL_RE.match(email) is not None
 
 
 @input_error
@@ -728,7 +1442,7 @@ def add_phone(book: AddressBook):
     record: Record = book.find(name)
 
     if not record:
-        raise Exception(ERROR + f"Contact with name {name} not found.")
+        raise Exception(_CONTACT_NOT_FOUND_ERROR(name))
 
     phone = input("Please type phone: ")
     return record.add_phone(phone)
@@ -737,23 +1451,39 @@ def add_phone(book: AddressBook):
 @as_table(title="Search Result")
 def find_contact(book: AddressBook):
     """Шукає контакт за значенням одного з полів."""
-    all_records = book.get_all()
     value = input("Please pass a value for search: ").strip()
 
-    for record in all_records:
-        record_dict = record.__dict__  # Отримуємо атрибути запису як словник
-
-        for _, field_value in record_dict.items():
-            if isinstance(field_value, list):
-                for item in field_value:
-                    if str(item) == str(value):
-                        return [record]
-            elif str(field_value) == value:
-                return [record]
+    record = book.find_by_value(value)
+    if record is None:
+        record = _find_by_display_value(book, value)
+    if record is not None:
+        return [record]
 
     return "Contact not found."
 
 
+def _find_by_display_value(book: AddressBook, value: str):
+    """
+    Шукає контакт за значенням у вигляді, як його показує застосунок.
+
+    Ім'я, телефони, email та адреса вже перевірені індексами; лишаються
+    телефон у форматі (###) ###-#-### і день народження DD.MM.YYYY, тож
+    за виглядом значення перевіряємо лише відповідне поле.
+    """
+    if value.startswith("("):
+        phone = Phone.tryparse(
+            "".join(ch for ch in value if ch.isdecimal())
+        )
+        if phone is not None and str(phone) == value:
+            return book.find_by_phone(phone.value)
+        return None
+
+    birthday = Birthday.tryparse(value)
+    if birthday is not None and str(birthday) == value:
+        return book.find_by_birthday(birthday.value)
+    return None
+
+
 @input_error
 def delete_contact(book: AddressBook):
     """Видаляє контакт за ім’ям."""
@@ -767,11 +1497,10 @@ def search_tags(book: AddressBook):
     value = input("Please pass a value for tag search: ").strip()
 
     result = []
-    for note in book.notes:
-        if note.tag and note.tag.lower() == value.lower():
-            result.append(
-                {"Title": note.title, "Note": note.note, "Tag": note.tag}
-            )
+    for note in book.find_notes_by_tag(value):
+        result.append(
+            {"Title": note.title, "Note": note.note, "Tag": note.tag}
+        )
     if result:
         return result
     return "Tag not found."
@@ -781,18 +1510,20 @@ def search_tags(book: AddressBook):
 def sort_tags(book: AddressBook):
     """Сортує нотатки за тегами."""
     return (
-        sorted(book.notes, key=lambda x: (x.tag is None, x.tag or ""))
+        book.get_notes_sorted_by_tag()
         if book.notes
         else "No notes found."
     )
 
 
+@lru_cache(maxsize=None)
 def get_data_path(filename="addressbook.pkl") -> str:
     """
     Get the full file path to the data file in the project directory.
 
     This function ensures that the 'data' folder exists inside the project
     directory and returns the full path to the specified filename.
+    The result is cached, so the folder check runs once per filename.
 
     :param filename: The name of the file to store/load data.
     :type filename: str
@@ -806,24 +1537,246 @@ def get_data_path(filename="addressbook.pkl") -> str:
     return os.path.join(data_folder, filename)
 
 
+def get_journal_path(path: str) -> str:
+    """Повертає шлях до журналу змін для файлу знімка."""
+    return os.path.splitext(path)[0] + ".jrnl"
+
+
+BOOK_FORMAT = "addressbook"
+BOOK_FORMAT_VERSION = 2
+# Колонки знімка версії 2 у порядку полів Record._to_row
+BOOK_COLUMNS = ("names", "phones", "birthdays", "emails", "addresses")
+
+
+def _legacy_reconstructor(cls, base, state):
+    """
+    copyreg._reconstructor для файлів протоколів 0-1.
+
+    Тоді AddressBook наслідувала UserDict і створювалась через
+    object.__new__, що для нинішнього підкласу dict недопустимо.
+    """
+    if base is object and state is None:
+        return cls.__new__(cls)
+    return copyreg._reconstructor(cls, base, state)
+
+
+class _BookUnpickler(pickle.Unpickler):
+    """
+    Unpickler, що не створює довільних об’єктів із файлу даних.
+
+    Новий формат складається лише з вбудованих типів; старі файли, де
+    pickle зберігав саму AddressBook, можуть посилатися тільки на класи
+    адресної книги та datetime.date.
+    """
+
+    _BOOK_MODULES = frozenset(("__main__", "main", __name__))
+    _BOOK_CLASSES = frozenset((
+        "AddressBook", "Record", "Field", "Name", "Phone", "Birthday",
+        "Email", "Address", "Note",
+    ))
+    _ALLOWED = frozenset((
+        ("datetime", "date"),
+        ("copyreg", "_reconstructor"),
+        ("builtins", "object"),
+        # bytes у протоколах 0-2 (стан datetime.date)
+        ("_codecs", "encode"),
+    ))
+
+    def find_class(self, module, name):
+        """Повертає клас лише з дозволеного списку."""
+        # Протоколи 0-2 пишуть імена Python 2 (copy_reg, __builtin__);
+        # перекладаємо їх так само, як стандартний Unpickler
+        if (module, name) in _compat_pickle.NAME_MAPPING:
+            module, name = _compat_pickle.NAME_MAPPING[(module, name)]
+        elif module in _compat_pickle.IMPORT_MAPPING:
+            module = _compat_pickle.IMPORT_MAPPING[module]
+        if module in self._BOOK_MODULES and name in self._BOOK_CLASSES:
+            # Класи книги беремо з цього модуля, хоч би під яким ім'ям
+            # (__main__ чи main) його було імпортовано під час збереження
+            return globals()[name]
+        if (module, name) == ("copyreg", "_reconstructor"):
+            return _legacy_reconstructor
+        if (module, name) in self._ALLOWED:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Forbidden global {module}.{name}")
+
+
+def _book_to_payload(book: AddressBook) -> dict:
+    """
+    Перетворює книгу на словник із вбудованих типів.
+
+    Записи зберігаються колонками (окремий список для кожного поля):
+    так у файлі менше кортежів, і він швидше розбирається.
+    """
+    rows = [record._to_row() for record in book.values()]
+    columns = zip(*rows) if rows else ((),) * len(BOOK_COLUMNS)
+    return {
+        "format": BOOK_FORMAT,
+        "version": BOOK_FORMAT_VERSION,
+        "journal_id": book._journal_id,
+        "columns": {
+            key: list(column) for key, column in zip(BOOK_COLUMNS, columns)
+        },
+        "notes": [note._to_row() for note in book.notes],
+    }
+
+
+def _book_from_payload(payload) -> AddressBook:
+    """Відновлює книгу з даних _book_to_payload або зі старого pickle."""
+    if isinstance(payload, AddressBook):
+        # Старий формат: pickle самої AddressBook
+        return payload
+    if not (
+        isinstance(payload, dict) and payload.get("format") == BOOK_FORMAT
+    ):
+        raise pickle.UnpicklingError("Unknown address book format")
+
+    if payload["version"] >= 2:
+        columns = payload["columns"]
+        rows = zip(*(columns[key] for key in BOOK_COLUMNS))
+    else:
+        rows = payload["records"]
+
+    book = AddressBook()
+    for row in rows:
+        book.add_record(Record._from_row(row))
+    book.notes = [Note._from_row(row) for row in payload["notes"]]
+    book._journal_id = payload["journal_id"]
+    return book
+
+
+def _write_snapshot(book: AddressBook, path: str):
+    """Атомарно записує повний знімок книги та скидає журнал змін."""
+    tmp_path = path + ".tmp"
+    previous_id = book._journal_id
+    # Новий ідентифікатор робить недійсним журнал попереднього знімка
+    book._journal_id = os.urandom(8).hex()
+    try:
+        # Знімок серіалізується в пам'ять і записується одним write
+        data = pickle.dumps(_book_to_payload(book), pickle.HIGHEST_PROTOCOL)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        book._journal_id = previous_id
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    journal_path = get_journal_path(path)
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+
+def _append_journal(book: AddressBook, journal_path: str):
+    """Дописує до журналу лише змінені з останнього збереження дані."""
+    changes = [
+        ("put", book[name]._to_row()) if name in book else ("del", name)
+        for name in book._changed
+    ]
+    if book._notes_changed:
+        changes.append(("notes", [note._to_row() for note in book.notes]))
+    frame = pickle.dumps(changes, pickle.HIGHEST_PROTOCOL)
+    with open(journal_path, "ab") as f:
+        # Кожен журнал починається з ідентифікатора свого знімка
+        if f.tell() == 0:
+            frame = pickle.dumps(
+                book._journal_id, pickle.HIGHEST_PROTOCOL
+            ) + frame
+        # Один write на збереження: кадр не розривається між викликами
+        f.write(frame)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _replay_journal(book: AddressBook, journal_path: str):
+    """Застосовує до завантаженого знімка зміни з журналу."""
+    with open(journal_path, "r+b", buffering=IO_BUFFER_SIZE) as f:
+        try:
+            journal_id = _BookUnpickler(f).load()
+        except (EOFError, pickle.UnpicklingError):
+            journal_id = None
+        if journal_id is None or journal_id != book._journal_id:
+            # Журнал лишився від старішого знімка — він уже не потрібен
+            f.close()
+            os.remove(journal_path)
+            return
+
+        valid_size = f.tell()
+        while True:
+            try:
+                changes = _BookUnpickler(f).load()
+            except (EOFError, pickle.UnpicklingError):
+                break
+            for action, value in changes:
+                if action == "put":
+                    book.add_record(Record._from_row(value))
+                elif action == "del":
+                    if value in book:
+                        book.delete(value)
+                elif action == "notes":
+                    book.notes = [Note._from_row(row) for row in value]
+                    book.mark_notes_changed()
+            valid_size = f.tell()
+        # Обрізаємо недописаний хвіст, щоб нові зміни не йшли після нього
+        f.truncate(valid_size)
+
+
 def save_data(book: AddressBook, filename="addressbook.pkl"):
     """
     Зберігає екземпляр AddressBook у файл даних за допомогою pickle.
 
+    Записи та нотатки зберігаються кортежами вбудованих типів, тож файл
+    не містить посилань на класи і швидше завантажується.
+
+    Якщо книгу вже збережено в цей файл, до журналу змін дописуються лише
+    змінені записи. Повний знімок записується у тимчасовий файл, який
+    після fsync атомарно заміняє основний, — коли журнал виростає у
+    JOURNAL_COMPACT_RATIO разів більшим за знімок, або після clear().
+
     :param book: Екземпляр AddressBook, який потрібно зберегти.
     :type book: AddressBook
     :param filename: Назва файлу, у який потрібно зберегти дані.
     :type filename: str
     """
+    if book._read_only:
+        return
     path = get_data_path(filename)
-    with open(path, "wb") as f:
-        pickle.dump(book, f)
+    journal_path = get_journal_path(path)
+    can_append = (
+        book._saved_to == path
+        and book._journal_id is not None
+        and not book._snapshot_required
+        and os.path.exists(path)
+    )
+    if can_append:
+        if not book._changed and not book._notes_changed:
+            return
+        journal_size = (
+            os.path.getsize(journal_path)
+            if os.path.exists(journal_path)
+            else 0
+        )
+        can_append = (
+            journal_size <= os.path.getsize(path) * JOURNAL_COMPACT_RATIO
+        )
+
+    if can_append:
+        _append_journal(book, journal_path)
+    else:
+        _write_snapshot(book, path)
+    book._reset_changes()
+    book._saved_to = path
 
 
 def load_data(filename="addressbook.pkl") -> AddressBook:
     """
     Завантажує екземпляр AddressBook з файлу даних за допомогою pickle.
 
+    Підтримує і новий формат, і старі файли з pickle самої AddressBook;
+    посилання на сторонні класи відхиляються. Після знімка
+    застосовуються зміни з журналу, дописані save_data.
     Якщо файл не існує, повертається новий порожній AddressBook.
 
     :param filename: Назва файлу, з якого потрібно завантажити дані.
@@ -838,43 +1791,127 @@ def load_data(filename="addressbook.pkl") -> AddressBook:
         return AddressBook()
 
     try:
-        with open(path, "rb") as f:
-            return pickle.load(f)
+        with open(path, "rb", buffering=IO_BUFFER_SIZE) as f:
+            book = _book_from_payload(_BookUnpickler(f).load())
+        journal_path = get_journal_path(path)
+        if book._journal_id is not None and os.path.exists(journal_path):
+            _replay_journal(book, journal_path)
+        book._reset_changes()
+        book._saved_to = path
+        return book
     except (FileNotFoundError, EOFError, pickle.UnpicklingError):
-        return AddressBook()
+        return _book_for_unreadable_data(path)
     except Exception as e:
         print(
             f"Error {e} has occurred.\n"
             + "We have handled this situation and you may proceed ☺️."
         )
-        return AddressBook()
+        return _book_for_unreadable_data(path)
+
+
+def _set_aside(path: str) -> str:
+    """Перейменовує файл у вільне ім'я path.bak, path.bak1, ..."""
+    target = path + ".bak"
+    number = 1
+    while os.path.exists(target):
+        target = f"{path}.bak{number}"
+        number += 1
+    os.replace(path, target)
+    return target
+
+
+def _book_for_unreadable_data(path: str) -> AddressBook:
+    """
+    Повертає порожню книгу замість файлу даних, який не вдалося прочитати.
+
+    Знімок і журнал відкладаються у *.bak, щоб наступне збереження не
+    затерло їх. Якщо відкласти не вдалося, книга не зберігатиметься.
+    """
+    book = AddressBook()
+    try:
+        moved = [
+            _set_aside(source)
+            for source in (path, get_journal_path(path))
+            if os.path.exists(source)
+        ]
+    except OSError as e:
+        book._read_only = True
+        print(
+            ERROR + f"Data file {path} could not be read or moved ({e}). "
+            "Changes in this session will not be saved."
+        )
+        return book
+    if moved:
+        print(
+            ERROR + "Data file could not be read and was moved to "
+            + ", ".join(moved) + ". Starting with an empty book."
+        )
+    return book
+
+
+# (словник команд, рядки таблиці) останнього виклику greeting_message
+_GREETING_ROWS = None
 
 
 @as_table(title="Command list")
 def greeting_message(commands_list):
-    """Повертає список доступних команд."""
-    return [
-        {
-            "command": command,
-            "description": commands_list[command].get("description", ""),
-            "end-section": commands_list[command].get("end-section", ""),
-        }
-        for command in commands_list
+    """Повертає список доступних команд (будується один раз на словник)."""
+    global _GREETING_ROWS
+    if _GREETING_ROWS is None or _GREETING_ROWS[0] is not commands_list:
+        rows = [
+            {
+                "command": command,
+                "description": commands_list[command].get("description", ""),
+                "end-section": commands_list[command].get("end-section", ""),
+            }
+            for command in commands_list
+        ]
+        _GREETING_ROWS = (commands_list, rows)
+    return _GREETING_ROWS[1]
+
+
+def complete_command(command_names, prefix):
+    """
+    Повертає єдину команду, що починається з prefix, або None.
+
+    Команди з PREFIX_EXCLUDED_COMMANDS за префіксом не повертаються.
+
+    :param command_names: Відсортовані назви команд.
+    :param prefix: Введений початок команди.
+    """
+    if not prefix:
+        return None
+    # Команди з цим префіксом ідуть підряд — достатньо двох сусідніх
+    start = bisect_left(command_names, prefix)
+    matches = [
+        name for name in command_names[start:start + 2]
+        if name.startswith(prefix)
     ]
+    if len(matches) != 1 or matches[0] in PREFIX_EXCLUDED_COMMANDS:
+        return None
+    return matches[0]
 
 
 @as_table(title="List of Similar Commands")
 def predict_command(commands_list, ratio, candidate=None):
     """Прогнозує команду на основі введеного тексту в якості команди."""
 
-    def similarity_ratio(s1, s2):
-        """Обчислює відсоток подібності між двома рядками."""
-        return SequenceMatcher(None, s1, s2).ratio() * 100
+    # difflib потрібен лише для помилково введених команд
+    from difflib import SequenceMatcher
 
     candidate_list = []
     if candidate:
+        # Один matcher на всі команди; real_quick_ratio і quick_ratio —
+        # дешеві верхні межі ratio, тож безнадійні команди відсіюються
+        # без повного порівняння
+        matcher = SequenceMatcher(None, candidate, autojunk=False)
         for command in commands_list:
-            if similarity_ratio(candidate, command) > ratio:
+            matcher.set_seq2(command)
+            if (
+                matcher.real_quick_ratio() * 100 > ratio
+                and matcher.quick_ratio() * 100 > ratio
+                and matcher.ratio() * 100 > ratio
+            ):
                 candidate_list.append({"similar commands": command})
 
     return (
@@ -886,92 +1923,107 @@ def predict_command(commands_list, ratio, candidate=None):
 
 def main():
     """Запускає основну логіку застосунку."""
-    from faker_data import fill_with_fake_data
+    # colorama скидає колір після кожного print і вмикає ANSI у Windows
+    from colorama import init
+
+    init(autoreset=True)
+
+    def generate_data(book):
+        """Заповнює книгу фейковими даними та показує результат."""
+        # faker завантажуємо лише за запитом, а не під час старту
+        from faker_data import fill_with_fake_data
+
+        return show_all(fill_with_fake_data(book))
 
     commands_list = {
         "add": {
             "description": "Add new contact",
-            "handler": lambda book: add_contact(book),
+            "handler": add_contact,
         },
         "change": {
             "description": "Change existing contact",
-            "handler": lambda book: change_contact(book),
+            "handler": change_contact,
+        },
+        "add-batch": {
+            "description": "Add contacts from a file " +
+                           "(name|phones|email|birthday|address)",
+            "handler": add_contacts_from_file,
         },
         "add-phone": {
             "description": "Add phone to existing contact",
-            "handler": lambda book: add_phone(book),
+            "handler": add_phone,
         },
         "add-email": {
             "description": "Add email to existing contact",
-            "handler": lambda book: add_email(book),
+            "handler": add_email,
         },
         "add-birthday": {
             "description": "Add birthday to existing contact",
-            "handler": lambda book: add_birthday(book),
+            "handler": add_birthday,
         },
         "add-address": {
             "description": "Add address to existing contact",
-            "handler": lambda book: add_address(book),
+            "handler": add_address,
         },
         "all": {
             "description": "Show all contacts",
-            "handler": lambda book: show_all(book),
+            "handler": show_all,
         },
         "phone": {
             "description": "Show the phone of existing contact",
-            "handler": lambda book: show_phone(book),
+            "handler": show_phone,
         },
         "show-birthday": {
             "description": "Show birthday of existing contact",
-            "handler": lambda book: show_birthday(book),
+            "handler": show_birthday,
         },
         "birthdays": {
             "description": "Show upcoming birthdays for " +
                            "a given period of time",
-            "handler": lambda book: birthdays(book),
+            "handler": birthdays,
         },
         "find": {
             "description": "Find contact by a given field",
-            "handler": lambda book: find_contact(book),
+            "handler": find_contact,
         },
         "delete": {
             "description": "Delete contact",
-            "handler": lambda book: delete_contact(book),
+            "handler": delete_contact,
             "end-section": True,
         },
         "add-note": {
             "description": "Add new note",
-            "handler": lambda book: add_note(book),
+            "handler": add_note,
         },
         "edit-note": {
             "description": "Edit an existing note",
-            "handler": lambda book: edit_note(book),
+            "handler": edit_note,
         },
         "delete-note": {
             "description": "Delete specific note",
-            "handler": lambda book: delete_note(book),
+            "handler": delete_note,
         },
         "show-notes": {
             "description": "Show all existing notes",
-            "handler": lambda book: show_notes(book),
+            "handler": show_notes,
         },
         "search-notes": {
             "description": "Search notes by keyword",
-            "handler": lambda book: search_note(book),
+            "handler": search_note,
             "end-section": True,
         },
         "search-tags": {
             "description": "Find notes by tag",
-            "handler": lambda book: search_tags(book),
+            "handler": search_tags,
         },
         "sort-tags": {
             "description": "Sort notes by tag",
-            "handler": lambda book: sort_tags(book),
+            "handler": sort_tags,
             "end-section": True,
         },
         "generate-data": {
             "description": "Generate fake data for testing",
-            "handler": lambda book: show_all(fill_with_fake_data(book)),
+            "handler": generate_data,
             "end-section": True,
         },
         "exit": {"description": "Leave the app", "handler": None},
@@ -979,30 +2031,45 @@ def main():
         "hello": {
             "description": "Greeting message",
             "handler": lambda _: "How can I help you?",
+            "needs_book": False,
         },
         "help": {
             "description": "Full list of commands",
             "handler": lambda _: greeting_message(commands_list),
+            "needs_book": False,
         },
 
     }
 
+    command_names = sorted(commands_list)
     goodbye_message = "Good bye!"
+    # Книгу завантажуємо при першій команді, якій вона справді потрібна
+    book = None
     try:
-        book = load_data()
         print("Welcome to the assistant bot!")
         print(greeting_message(commands_list))
         while True:
             command = input("Enter a command: ").strip()
             if command:
-                command = command.lower().split()[0]
-
-            if command in ["close", "exit"]:
+                command = command.split(maxsplit=1)[0].lower()
+                if command not in commands_list:
+                    # Однозначний початок команди виконує саму команду
+                    command = complete_command(
+                        command_names, command
+                    ) or command
+
+            if command in EXIT_COMMANDS:
                 break
 
-            elif command in commands_list:
-                print(commands_list[command]["handler"](book))
-
+            entry = commands_list.get(command)
+            if entry is not None:
+                if book is None and entry.get("needs_book", True):
+                    book = load_data()
+                print(entry["handler"](book))
+                if book is not None:
+                    # Зміни одразу дописуються в журнал (без змін — нічого не
+                    # пишеться), тож аварійне завершення їх не втрачає
+                    save_data(book)
             else:
                 predict_command(commands_list, 50, command)
 
@@ -1010,7 +2077,8 @@ def main():
         print("\nSaving data...")
     finally:
         print(goodbye_message)
-        save_data(book)
+        if book is not None:
+            save_data(book)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,18 @@
 """Unit tests for the main Assistant Bot functionality."""
 
+import importlib.util
 import os
 import pickle
 import tempfile
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest import mock
 from unittest.mock import patch
 
 from main import (
     AddressBook,
     Birthday,
+    Email,
     Name,
     Note,
     Phone,
@@ -18,19 +20,23 @@ from main import (
     add_address,
     add_birthday,
     add_contact,
+    add_contact_batch,
     add_email,
     add_note,
     add_phone,
     birthdays,
     change_contact,
+    complete_command,
     delete_contact,
     delete_note,
     edit_note,
     find_contact,
     get_data_path,
+    get_journal_path,
     greeting_message,
     is_valid_email,
     load_data,
+    main,
     predict_command,
     save_data,
     search_note,
@@ -93,6 +99,36 @@ class TestFieldClasses(unittest.TestCase):
         with self.assertRaises(Exception):
             Phone(INVALID_USER["phone"])
 
+    def test_unchecked_phone_skips_validation(self):
+        """Test that trusted values bypass the phone validator."""
+        phone = Phone._unchecked(INVALID_USER["phone"])
+        self.assertIsInstance(phone, Phone)
+        self.assertEqual(phone.value, INVALID_USER["phone"])
+
+    def test_tryparse_returns_none_for_invalid_values(self):
+        """Test that tryparse validates without raising exceptions."""
+        self.assertEqual(
+            Phone.tryparse(VALID_USER["phone"]).value, VALID_USER["phone"]
+        )
+        self.assertIsNone(Phone.tryparse(INVALID_USER["phone"]))
+        self.assertEqual(
+            Birthday.tryparse(VALID_USER["birthday"]).value,
+            VALID_USER["birthday_date"],
+        )
+        self.assertIsNone(Birthday.tryparse(INVALID_USER["birthday"]))
+        self.assertIsNone(Email.tryparse(INVALID_USER["email"]))
+
+    def test_tryparse_interns_values_like_constructor(self):
+        """Test that tryparse and __init__ share one string per value."""
+        phone = "".join(VALID_USER["phone"])
+        email = "".join(VALID_USER["email"])
+        self.assertIs(
+            Phone.tryparse(phone).value, Phone(VALID_USER["phone"]).value
+        )
+        self.assertIs(
+            Email.tryparse(email).value, Email(VALID_USER["email"]).value
+        )
+
     def test_valid_birthday(self):
         """Test that a valid birthday string is correctly parsed into date."""
         b_day = Birthday(VALID_USER["birthday"])
@@ -103,6 +139,13 @@ class TestFieldClasses(unittest.TestCase):
         with self.assertRaises(Exception):
             Birthday(INVALID_USER["birthday"])
 
+    def test_birthday_parsing_matches_strptime(self):
+        """Test that birthdays are parsed and printed like with strptime."""
+        self.assertEqual(str(Birthday("1.2.2000")), "01.02.2000")
+        for value in ("31.02.2000", "01.01.20", "01.01.2000.", "a1.01.2000"):
+            with self.assertRaises(Exception):
+                Birthday(value)
+
 
 class TestNotes(unittest.TestCase):
     """Unit tests for the note-related functionality in AddressBook."""
@@ -161,6 +204,17 @@ class TestNotes(unittest.TestCase):
         self.assertEqual(self.book.notes[0].note,"Some text")
         self.assertEqual(self.book.notes[0].tag, "#new")
 
+    def test_edit_note_tag_is_interned(self):
+        """Test that an edited tag is the same string as a new note's tag."""
+        self.book.add_note(Note("Plan", "Some text", "#old"))
+        with patch(
+                "builtins.input",
+                side_effect=["Plan", "tag", "".join("#shared")]
+        ):
+            edit_note(self.book)
+        fresh = Note("Other", "Text", "".join("#shared"))
+        self.assertIs(self.book.notes[0].tag, fresh.tag)
+
     def test_delete_note(self):
         """Test that a note can be deleted by its title."""
         self.book.add_note(Note("Shopping", "Eggs and milk"))
@@ -169,6 +223,30 @@ class TestNotes(unittest.TestCase):
         self.assertIn("Deleted", result)
         self.assertEqual(len(self.book.notes), 0)
 
+    def test_delete_notes_by_tag(self):
+        """Test that deleting by tag removes every matching note."""
+        for title in ("One", "Two", "Three"):
+            self.book.add_note(Note(title, "Text", "#old"))
+        self.book.add_note(Note("Keep", "Text", "#new"))
+        with patch("builtins.input", side_effect=["tag", "#old"]):
+            result = delete_note(self.book)
+        self.assertIn("Deleted 3", result)
+        self.assertEqual([n.title for n in self.book.notes], ["Keep"])
+
+    def test_note_lookups_follow_edits(self):
+        """Test that title and tag lookups see edited and removed notes."""
+        self.book.add_note(Note("Plan", "Some text", "#old"))
+        self.assertEqual(len(self.book.find_notes_by_tag("#OLD")), 1)
+        with patch(
+                "builtins.input",
+                side_effect=["plan", "tag", "#new"]
+        ):
+            edit_note(self.book)
+        self.assertEqual(self.book.find_notes_by_tag("#old"), [])
+        self.assertEqual(len(self.book.find_notes_by_tag("#new")), 1)
+        self.book.remove_note(self.book.find_notes_by_title("PLAN")[0])
+        self.assertEqual(self.book.search_notes("text"), [])
+
     def test_search_notes_by_title(self):
         """Test that searching notes by title returns expected result."""
         self.book.add_note(Note("Trip", "Pack luggage", "#travel"))
@@ -197,6 +275,17 @@ class TestNotes(unittest.TestCase):
         result = sort_tags(self.book)
         self.assertEqual(result, "")
 
+    def test_sorted_notes_follow_changes(self):
+        """Test that the cached tag order is refreshed after edits."""
+        self.book.add_note(Note("B", "content", "#beta"))
+        self.book.add_note(Note("None", "no tag"))
+        self.book.get_notes_sorted_by_tag()
+        self.book.add_note(Note("A", "content", "#alpha"))
+        self.assertEqual(
+            [n.title for n in self.book.get_notes_sorted_by_tag()],
+            ["A", "B", "None"],
+        )
+
 
 class TestUtils(unittest.TestCase):
     """Unit tests for utility functions like command prediction & greetings."""
@@ -216,6 +305,30 @@ class TestUtils(unittest.TestCase):
         result = predict_command(commands, 90, candidate="xyz")
         self.assertEqual(result, "")
 
+    def test_complete_command(self):
+        """Test that only an unambiguous prefix completes to a command."""
+        names = sorted(["add", "add-phone", "phone", "show-notes", "sort"])
+        self.assertEqual(complete_command(names, "ph"), "phone")
+        self.assertEqual(complete_command(names, "add-"), "add-phone")
+        self.assertIsNone(complete_command(names, "s"))
+        self.assertIsNone(complete_command(names, "xyz"))
+        self.assertIsNone(complete_command(names, ""))
+        self.assertIsNone(
+            complete_command(sorted(["add", "generate-data"]), "g")
+        )
+
+    def test_prefix_does_not_run_generate_data(self):
+        """Test that typing 'g' suggests commands instead of wiping data."""
+        with patch("builtins.input", side_effect=["g", "exit"]), \
+                patch("builtins.print"), \
+                patch("main.load_data", return_value=AddressBook()), \
+                patch("main.save_data"), \
+                patch("main.predict_command") as predict, \
+                patch("faker_data.fill_with_fake_data") as fill:
+            main()
+        fill.assert_not_called()
+        predict.assert_called_once()
+
     def test_greeting_message_output(self):
         """Test that greeting_message returns a formatted help message."""
         commands = {
@@ -243,8 +356,10 @@ class TestSaveLoad(unittest.TestCase):
 
     def tearDown(self):
         """Clean up function per test within class."""
-        if os.path.isfile(self.data_path):
-            os.remove(self.data_path)
+        for path in (self.data_path, get_journal_path(self.data_path)):
+            for name in (path, path + ".bak", path + ".bak1"):
+                if os.path.isfile(name):
+                    os.remove(name)
 
     def test_get_data_path_folder_created(self):
         """Test that get_data_path creates the folder if not present."""
@@ -256,6 +371,48 @@ class TestSaveLoad(unittest.TestCase):
         save_data(self.book, self.filename)
         self.assertTrue(os.path.exists(self.data_path))
 
+    def test_save_data_interrupted_keeps_previous_file(self):
+        """Test that a failed save leaves the previous data file intact."""
+        save_data(self.book, self.filename)
+        with mock.patch("os.fsync", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                save_data(AddressBook(), self.filename)
+        self.assertFalse(os.path.exists(self.data_path + ".tmp"))
+        loaded = load_data(self.filename)
+        self.assertIn(VALID_USER["name"], loaded)
+
+    def test_save_data_uses_highest_protocol(self):
+        """Test that save_data writes the pickle with the newest protocol."""
+        save_data(self.book, self.filename)
+        with open(self.data_path, "rb") as f:
+            header = f.read(2)
+        self.assertEqual(header, bytes([0x80, pickle.HIGHEST_PROTOCOL]))
+
+    def test_save_data_appends_changes_to_journal(self):
+        """Test that a repeated save journals only the changed records."""
+        save_data(self.book, self.filename)
+        with open(self.data_path, "rb") as f:
+            snapshot = f.read()
+
+        loaded = load_data(self.filename)
+        loaded[VALID_USER["name"]].add_email(VALID_USER["email"])
+        loaded.add_record(Record("Second"))
+        loaded.add_note(Note("Title", "Text"))
+        save_data(loaded, self.filename)
+        loaded = load_data(self.filename)
+        loaded.delete("Second")
+        save_data(loaded, self.filename)
+
+        with open(self.data_path, "rb") as f:
+            self.assertEqual(f.read(), snapshot)
+        self.assertTrue(os.path.exists(get_journal_path(self.data_path)))
+        restored = load_data(self.filename)
+        self.assertEqual(
+            restored[VALID_USER["name"]].email.value, VALID_USER["email"]
+        )
+        self.assertNotIn("Second", restored)
+        self.assertEqual(len(restored.notes), 1)
+
     def test_load_data_returns_correct_content(self):
         """Test that load_data returns AddressBook with expected content."""
         save_data(self.book, self.filename)
@@ -285,6 +442,34 @@ class TestSaveLoad(unittest.TestCase):
         self.assertIsInstance(loaded, AddressBook)
         self.assertEqual(len(loaded.data), 0)
 
+    def test_load_data_sets_aside_unreadable_file(self):
+        """Test that an unreadable data file is moved aside, not replaced."""
+        content = b"This is not valid pickle content."
+        with open(self.data_path, "wb") as f:
+            f.write(content)
+
+        with patch("builtins.print"):
+            loaded = load_data(self.filename)
+        loaded.add_record(Record("Second"))
+        save_data(loaded, self.filename)
+        with open(self.data_path + ".bak", "rb") as f:
+            self.assertEqual(f.read(), content)
+        self.assertIn("Second", load_data(self.filename))
+
+    def test_load_data_stops_saving_when_file_cannot_be_moved(self):
+        """Test that save_data keeps an unreadable file it could not move."""
+        content = b"This is not valid pickle content."
+        with open(self.data_path, "wb") as f:
+            f.write(content)
+
+        with patch("builtins.print"), \
+                patch("os.replace", side_effect=PermissionError):
+            loaded = load_data(self.filename)
+        loaded.add_record(Record("Second"))
+        save_data(loaded, self.filename)
+        with open(self.data_path, "rb") as f:
+            self.assertEqual(f.read(), content)
+
     def test_load_data_eof_error(self):
         """Test that EOFError is handled gracefully."""
         with open(self.data_path, 'wb'):
@@ -294,6 +479,48 @@ class TestSaveLoad(unittest.TestCase):
         self.assertIsInstance(loaded, AddressBook)
         self.assertEqual(len(loaded.data), 0)
 
+    def test_load_legacy_userdict_state(self):
+        """Test that state pickled by the UserDict-based book is migrated."""
+        loaded = AddressBook.__new__(AddressBook)
+        loaded.__setstate__({"data": {VALID_USER["name"]: self.record},
+                             "notes": [Note("Title", "Text")]})
+        self.assertIs(loaded.find(VALID_USER["name"]), self.record)
+        self.assertEqual(len(loaded.notes), 1)
+        self.assertIsInstance(loaded.get_upcoming_birthdays(366), list)
+
+    def test_load_data_reads_protocol_0_pickle(self):
+        """Test that a protocol 0 file from the UserDict-based book loads."""
+        content = (
+    b'ccopy_reg\n_reconstructor\np0\n(cmain\nAddressBook\np1\n'
+    b'c__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nVdata\np6\n'
+    b'(dp7\nVZoe\np8\ng0\n(cmain\nRecord\np9\ng2\nNtp10\nRp11\n'
+    b'(dp12\nVname\np13\ng0\n(cmain\nName\np14\ng2\nNtp15\nRp16\n'
+    b'(dp17\nVvalue\np18\ng8\nsbsVphones\np19\n(lp20\ng0\n'
+    b'(cmain\nPhone\np21\ng2\nNtp22\nRp23\n(dp24\ng18\n'
+    b'V1234567890\np25\nsbasVbirthday\np26\ng0\n(cmain\n'
+    b'Birthday\np27\ng2\nNtp28\nRp29\n(dp30\ng18\ncdatetime\n'
+    b'date\np31\n(c_codecs\nencode\np32\n(V\x07\xc6\x02\x01\n'
+    b'p33\nVlatin1\np34\ntp35\nRp36\ntp37\nRp38\nsbsVemail\np39\n'
+    b'NsVaddress\np40\nNsbssVnotes\np41\n(lp42\nsb.'
+        )
+        with open(self.data_path, "wb") as f:
+            f.write(content)
+
+        loaded = load_data(self.filename)
+        self.assertFalse(os.path.exists(self.data_path + ".bak"))
+        self.assertIs(loaded.find_by_phone("1234567890"), loaded.find("Zoe"))
+        self.assertEqual(loaded.find("Zoe").birthday.value,
+                         datetime(1990, 2, 1).date())
+
+    def test_load_data_rejects_foreign_globals(self):
+        """Test that a data file referencing other callables is refused."""
+        with open(self.data_path, "wb") as f:
+            pickle.dump(os.system, f)
+
+        loaded = load_data(self.filename)
+        self.assertIsInstance(loaded, AddressBook)
+        self.assertEqual(len(loaded), 0)
+
     def test_load_data_generic_exception(self):
         """Test that unexpected exceptions during load return empty book."""
         with open(self.data_path, 'wb') as f:
@@ -318,6 +545,24 @@ class TestRecord(unittest.TestCase):
         self.record.add_phone(VALID_USER["phone"])
         self.assertEqual(self.record.phones[0].value, VALID_USER["phone"])
 
+    def test_add_phones_validates_all_first(self):
+        """Test that add_phones adds nothing when any phone is invalid."""
+        with self.assertRaises(Exception):
+            self.record.add_phones(
+                [VALID_USER["phone"], INVALID_USER["phone"]]
+            )
+        self.assertEqual(self.record.phones, [])
+        self.record.add_phones(
+            [VALID_USER["phone"], ADDITIONAL_DATA["new_phone"]]
+        )
+        self.assertEqual(
+            [p.value for p in self.record.phones],
+            [VALID_USER["phone"], ADDITIONAL_DATA["new_phone"]],
+        )
+        self.assertIsNotNone(
+            self.record.find_phone(ADDITIONAL_DATA["new_phone"])
+        )
+
     def test_edit_phone_success(self):
         """Test that an existing phone number is updated correctly."""
         self.record.add_phone(VALID_USER["phone"])
@@ -335,12 +580,38 @@ class TestRecord(unittest.TestCase):
         with self.assertRaises(Exception):
             self.record.edit_phone("0000000000", VALID_USER["phone"])
 
+    def test_remove_phone(self):
+        """Test that every copy of a phone is removed from the record."""
+        self.record.add_phone(VALID_USER["phone"])
+        self.record.add_phone(ADDITIONAL_DATA["new_phone"])
+        self.record.add_phone(VALID_USER["phone"])
+        phones = self.record.phones
+        self.record.remove_phone(VALID_USER["phone"])
+        self.assertIs(self.record.phones, phones)
+        self.assertEqual(
+            [p.value for p in self.record.phones],
+            [ADDITIONAL_DATA["new_phone"]]
+        )
+
     def test_find_phone_found(self):
         """Test that an existing phone number is found in the record."""
         self.record.add_phone(VALID_USER["phone"])
         phone = self.record.find_phone(VALID_USER["phone"])
         self.assertIsNotNone(phone)
 
+    def test_find_phone_after_edit(self):
+        """Test that the phone index follows edited numbers."""
+        self.record.add_phone(VALID_USER["phone"])
+        self.record.edit_phone(
+            VALID_USER["phone"],
+            ADDITIONAL_DATA["new_phone"]
+        )
+        self.assertIsNone(self.record.find_phone(VALID_USER["phone"]))
+        self.assertIs(
+            self.record.find_phone(ADDITIONAL_DATA["new_phone"]),
+            self.record.phones[0]
+        )
+
     def test_find_phone_not_found(self):
         """Test that searching for an unknown phone returns None."""
         phone = self.record.find_phone("0000000000")
@@ -369,6 +640,48 @@ class TestRecord(unittest.TestCase):
         result = self.record.add_email(VALID_USER["email"])
         self.assertEqual(result, "Email added.")
 
+    def test_record_uses_slots(self):
+        """Test that records and their fields carry no per-instance dict."""
+        self.record.add_phone(VALID_USER["phone"])
+        self.assertFalse(hasattr(self.record, "__dict__"))
+        self.assertFalse(hasattr(self.record.phones[0], "__dict__"))
+
+    def test_record_restores_legacy_dict_state(self):
+        """Test that records pickled before __slots__ still load."""
+        phone = Phone.__new__(Phone)
+        phone.__setstate__({"value": VALID_USER["phone"]})
+        record = Record.__new__(Record)
+        record.__setstate__({"name": Name(VALID_USER["name"]),
+                             "phones": [phone]})
+        self.assertEqual(record.phones[0].value, VALID_USER["phone"])
+        self.assertIsNone(record.email)
+        self.assertIsNone(record.birthday)
+
+    def test_record_str_reflects_changes(self):
+        """Test that the cached text of a record is rebuilt after edits."""
+        self.record.add_phone(VALID_USER["phone"])
+        self.assertIs(str(self.record), str(self.record))
+        self.record.add_email(VALID_USER["email"])
+        self.assertIn(VALID_USER["email"], str(self.record))
+        self.record.edit_phone(
+            VALID_USER["phone"], ADDITIONAL_DATA["new_phone"]
+        )
+        self.assertIn(ADDITIONAL_DATA["new_phone"], str(self.record))
+
+    def test_record_pickles_as_compact_row(self):
+        """Test that a pickled record round-trips through its row state."""
+        self.record.add_phone(VALID_USER["phone"])
+        self.record.add_birthday(VALID_USER["birthday"])
+        self.record.add_email(VALID_USER["email"])
+        data = pickle.dumps(self.record, pickle.HIGHEST_PROTOCOL)
+        self.assertNotIn(b"Phone", data)
+        restored = pickle.loads(data)
+        self.assertEqual(restored.find_phone(VALID_USER["phone"]).value,
+                         VALID_USER["phone"])
+        self.assertEqual(restored.birthday.value,
+                         VALID_USER["birthday_date"])
+        self.assertEqual(restored.email.value, VALID_USER["email"])
+
 
 class TestAddressBook(unittest.TestCase):
     """Unit tests for AddressBook class: adding, finding, deleting records."""
@@ -407,6 +720,79 @@ class TestAddressBook(unittest.TestCase):
         result = self.book.get_upcoming_birthdays(7)
         self.assertIsInstance(result, list)
 
+    def test_get_upcoming_birthdays_tracks_record_changes(self):
+        """Test that birthdays set or removed after adding are indexed."""
+        upcoming = datetime.today().date() + timedelta(days=3)
+        rec = Record(ADDITIONAL_DATA["new_name"])
+        self.book.add_record(rec)
+        rec.add_birthday(upcoming.strftime("%d.%m.2000"))
+        result = self.book.get_upcoming_birthdays(7)
+        self.assertIn(
+            {
+                "name": ADDITIONAL_DATA["new_name"],
+                "congratulation_date": upcoming.strftime("%d.%m.%Y"),
+            },
+            result,
+        )
+        self.book.delete(ADDITIONAL_DATA["new_name"])
+        names = [r["name"] for r in self.book.get_upcoming_birthdays(7)]
+        self.assertNotIn(ADDITIONAL_DATA["new_name"], names)
+
+    def test_find_by_value_tracks_record_changes(self):
+        """Test that phone and email lookups follow edits and deletes."""
+        rec = self.book.find(VALID_USER["name"])
+        self.assertIs(self.book.find_by_value(VALID_USER["phone"]), rec)
+        rec.edit_phone(VALID_USER["phone"], ADDITIONAL_DATA["new_phone"])
+        self.assertIsNone(self.book.find_by_value(VALID_USER["phone"]))
+        self.assertIs(
+            self.book.find_by_value(ADDITIONAL_DATA["new_phone"]), rec
+        )
+        rec.add_email(VALID_USER["email"])
+        self.assertIs(self.book.find_by_value(VALID_USER["email"]), rec)
+        self.book.delete(VALID_USER["name"])
+        self.assertIsNone(self.book.find_by_value(VALID_USER["email"]))
+
+    def test_find_by_value_prefers_first_added_contact(self):
+        """Test that a shared value resolves to the earliest added contact."""
+        first = Record("Zoe")
+        first.add_address("Same st")
+        first.add_phone(ADDITIONAL_DATA["new_phone"])
+        second = Record("Adam")
+        second.add_address("Same st")
+        self.book.add_record(first)
+        self.book.add_record(second)
+        self.assertIs(self.book.find_by_value("Same st"), first)
+        second.add_phone(ADDITIONAL_DATA["new_phone"])
+        self.assertIs(
+            self.book.find_by_value(ADDITIONAL_DATA["new_phone"]), first
+        )
+        # A later contact's name does not outrank an earlier email match
+        first.add_email("adam@example.com")
+        self.book.add_record(Record("adam@example.com"))
+        self.assertIs(self.book.find_by_value("adam@example.com"), first)
+
+    def test_find_by_value_indexes_records_from_another_module(self):
+        """Test lookups for records built by a second copy of main.
+
+        faker_data imports main while the app runs as __main__, so its
+        records come from a different module instance.
+        """
+        spec = importlib.util.spec_from_file_location(
+            "main_copy", importlib.util.find_spec("main").origin
+        )
+        other = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(other)
+        rec = other.Record(ADDITIONAL_DATA["new_name"])
+        rec.add_phone(ADDITIONAL_DATA["new_phone"])
+        rec.add_email(VALID_USER["email"])
+        rec.add_address(VALID_USER["address"])
+        self.book.add_record(rec)
+        self.assertIs(self.book.find_by_value(VALID_USER["email"]), rec)
+        self.assertIs(self.book.find_by_value(VALID_USER["address"]), rec)
+        self.assertIs(
+            self.book.find_by_value(ADDITIONAL_DATA["new_phone"]), rec
+        )
+
 
 class TestFunctions(unittest.TestCase):
     """Integration tests for user-level command functions on AddressBook."""
@@ -431,6 +817,34 @@ class TestFunctions(unittest.TestCase):
             result = find_contact(self.book)
         self.assertEqual(result, "")
 
+    def test_add_contact_batch(self):
+        """Test that a contact line is validated and added in one pass."""
+        result = add_contact_batch(
+            self.book,
+            "Anna|0123456789, 1112223333|anna@mail.com|02.02.2000|Kyiv\n",
+        )
+        self.assertEqual(result, "Contact added.")
+        record = self.book.find("Anna")
+        self.assertEqual(len(record.phones), 2)
+        self.assertEqual(record.email.value, "anna@mail.com")
+        self.assertEqual(str(record.birthday), "02.02.2000")
+        with self.assertRaises(Exception) as error:
+            add_contact_batch(self.book, "Bob|123|wrong-email|31-12-1990")
+        self.assertIn("123", str(error.exception))
+        self.assertIn("wrong-email", str(error.exception))
+        self.assertNotIn("Bob", self.book)
+
+    def test_find_contact_by_displayed_values(self):
+        """Test that formatted phones and birthdays are found as shown."""
+        self.book.find(VALID_USER["name"]).add_birthday(
+            VALID_USER["birthday"]
+        )
+        for value in ("(123) 45-67-890", VALID_USER["birthday"]):
+            with patch("builtins.input", return_value=value):
+                self.assertEqual(find_contact(self.book), "")
+        with patch("builtins.input", return_value="(123) 4567890"):
+            self.assertEqual(find_contact(self.book), "Contact not found.")
+
     def test_find_contact_not_found(self):
         """Test that searching for an unknown contact returns error message."""
         with patch("builtins.input", return_value="NoMatch"):
@@ -573,6 +987,16 @@ class TestFunctions(unittest.TestCase):
             result = add_address(self.book)
         self.assertIn("Address added", result)
 
+    def test_add_address_too_short(self):
+        """Test that the handler rejects an address shorter than 2 chars."""
+        with patch(
+                "builtins.input",
+                side_effect=[VALID_USER["name"], INVALID_USER["address"]]
+        ):
+            result = add_address(self.book)
+        self.assertIn("Address should contain at least 2 characters", result)
+        self.assertIsNone(self.book.find(VALID_USER["name"]).address)
+
     def test_add_address_invalid(self):
         """Test that error is returned when adding address fails."""
         result = add_address(